@@ -19,6 +19,9 @@ ICONS_PATH = os.path.join(MODULE_PATH, "icons")
 
 SHELF_NAME = "ExternalTools"
 
+# chunk size used when the module file has to be copied through python
+COPY_BUFSIZE = 1024 * 1024 if sys.platform == "win32" else 64 * 1024
+
 BUTTON_ADD_TO_CURRENT_SHELF = "Add to current shelf"
 BUTTON_ADD_TO_NEW_SHELF = "Add to a new shelf"
 BUTTON_ADD_TO_SHELF = "Add to shelf"
@@ -27,6 +30,38 @@ BUTTON_QUIT = "Quit"
 
 logger = logging.getLogger(__name__)
 
+# os.stat results per path, None when the path doesn't exist
+_stat_cache = {}
+_MISSING = object()
+
+# memoized by get_top_level_shelf
+_top_level_shelf = None
+
+
+def _stat(path):
+    """
+    Cached os.stat, invalidate with _stat_cache.pop(path, None) after touching the path
+    :param str path:
+    :return: None if the path doesn't exist
+    """
+    stat = _stat_cache.get(path, _MISSING)
+    if stat is _MISSING:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            stat = None
+        _stat_cache[path] = stat
+    return stat
+
+
+def _exists(path):
+    """
+    Cached os.path.exists
+    :param str path:
+    :rtype: bool
+    """
+    return _stat(path) is not None
+
 
 def is_module_loaded(module_name):
     """
@@ -46,14 +81,79 @@ def add_icons_path(path):
     """
     :param str path:
     """
-    icon_paths = os.environ.get(ENV_ICON_PATH, "").split(";")
+    icon_paths = [p for p in os.environ.get(ENV_ICON_PATH, "").split(";") if p]
+    if os.path.normcase(path) in set(os.path.normcase(p) for p in icon_paths):
+        return
     icon_paths.append(path)
     os.environ[ENV_ICON_PATH] = ";".join(icon_paths)
 
 
-def copy_module_to_user_folder(module_file_path):
+def _fast_copy(src, dst):
+    """
+    Copy the content of src to dst, letting the OS do the copy in kernel space when possible
+    (CopyFileW on windows, sendfile on linux) and falling back to a buffered read/write loop otherwise.
+    :param str src:
+    :param str dst:
+    """
+    if sys.platform == "win32":
+        try:
+            import ctypes
+            if ctypes.windll.kernel32.CopyFileW(ctypes.c_wchar_p(src), ctypes.c_wchar_p(dst), False):
+                return
+        except (ImportError, AttributeError, OSError):
+            pass
+    elif hasattr(os, "sendfile") and sys.platform.startswith("linux"):
+        src_fd = os.open(src, os.O_RDONLY)
+        try:
+            dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC)
+            try:
+                remaining = os.fstat(src_fd).st_size
+                offset = 0
+                try:
+                    while remaining > 0:
+                        sent = os.sendfile(dst_fd, src_fd, offset, min(remaining, 2 ** 30))
+                        if not sent:
+                            break
+                        offset += sent
+                        remaining -= sent
+                    return
+                except OSError:
+                    # sendfile not supported between these files, only give up if nothing was written yet
+                    if offset:
+                        raise
+            finally:
+                os.close(dst_fd)
+        finally:
+            os.close(src_fd)
+
+    buf = bytearray(COPY_BUFSIZE)
+    view = memoryview(buf)
+    with open(src, "rb") as fsrc:
+        with open(dst, "wb") as fdst:
+            while True:
+                size = fsrc.readinto(buf)
+                if not size:
+                    break
+                fdst.write(view[:size])
+
+
+def _module_path_line(first_line):
+    """
+    Return the first line of the module file pointing to the actual location of the module
+    :param bytes first_line: line ending included, it is preserved
+    :rtype: bytes
+    """
+    content = first_line.rstrip(b"\r\n")
+    line_ending = first_line[len(content):]
+    no_change, _, _ = content.strip().rpartition(b".")
+    module_path = os.path.realpath(MODULE_PATH)
+    if not isinstance(module_path, bytes):
+        module_path = module_path.encode(sys.getfilesystemencoding())
+    return no_change + module_path + line_ending
+
+
+def get_user_modules_folder():
     """
-    :param str module_file_path:
     :rtype: str
     """
     # this is dumb -_-
@@ -67,29 +167,67 @@ def copy_module_to_user_folder(module_file_path):
         user_documents_folder = os.path.join(user_documents_folder, "Documents")
     else:
         user_documents_folder = os.path.expanduser("~")
-    user_modules_folder = os.path.join(user_documents_folder, "maya", "modules")
+    return os.path.join(user_documents_folder, "maya", "modules")
 
-    if not os.path.exists(user_modules_folder):
-        os.makedirs(user_modules_folder)
 
-    shutil.copy2(module_file_path, user_modules_folder)
-    destination_path = os.path.join(user_modules_folder, MODULE_FILE_NAME)
-    if not os.path.exists(destination_path):
-        return None
+def is_module_file_up_to_date(module_file_path, destination_path):
+    """
+    Check if destination_path is already a copy of module_file_path pointing to this module location
+    :param str module_file_path:
+    :param str destination_path:
+    :rtype: bool
+    """
+    source_stat = _stat(module_file_path)
+    destination_stat = _stat(destination_path)
+    if source_stat is None or destination_stat is None:
+        return False
 
-    with open(destination_path, "r") as fp:
-        modules_lines = fp.readlines()
+    with open(module_file_path, "rb") as fp:
+        source_first_line = fp.readline()
+    expected_first_line = _module_path_line(source_first_line)
+    expected_size = source_stat.st_size - len(source_first_line) + len(expected_first_line)
+    if destination_stat.st_size != expected_size:
+        return False
 
-    if not modules_lines:
-        return None
+    with open(destination_path, "rb") as fp:
+        return fp.readline() == expected_first_line
 
-    first_line = modules_lines[0].strip()
-    no_change, _, _ = first_line.rpartition(".")
-    first_line = "{0}{1}".format(no_change, os.path.realpath(MODULE_PATH))
-    modules_lines[0] = first_line
 
-    with open(destination_path, "w") as fp:
-        fp.write("\n".join(modules_lines))
+def copy_module_to_user_folder(module_file_path):
+    """
+    :param str module_file_path:
+    :rtype: str
+    """
+    user_modules_folder = get_user_modules_folder()
+
+    if not _exists(user_modules_folder):
+        os.makedirs(user_modules_folder)
+        _stat_cache.pop(user_modules_folder, None)
+
+    destination_path = os.path.join(user_modules_folder, MODULE_FILE_NAME)
+    _fast_copy(module_file_path, destination_path)
+    shutil.copystat(module_file_path, destination_path)
+    _stat_cache.pop(destination_path, None)
+    if not _exists(destination_path):
+        return None
+
+    with open(destination_path, "r+b") as fp:
+        first_line = fp.readline()
+        if not first_line:
+            return None
+
+        new_first_line = _module_path_line(first_line)
+        if len(new_first_line) == len(first_line):
+            fp.seek(0)
+            fp.write(new_first_line)
+        else:
+            rest = fp.read()
+            fp.seek(0)
+            fp.truncate()
+            fp.write(new_first_line)
+            fp.write(rest)
+    # the rewrite changed the size and modification time cached by _exists above
+    _stat_cache.pop(destination_path, None)
 
     return destination_path
 
@@ -98,9 +236,8 @@ def add_to_shelf(destination_shelf=None):
     """
     :param str destination_shelf:
     """
-    top_level_shelf = get_top_level_shelf()
-
     if destination_shelf is None:
+        top_level_shelf = get_top_level_shelf()
         shelves = cmds.shelfTabLayout(top_level_shelf, query=True, childArray=True) or []
         destination_shelf = SHELF_NAME if SHELF_NAME in shelves else cmds.shelfLayout(SHELF_NAME,
                                                                                       parent=top_level_shelf)
@@ -108,8 +245,9 @@ def add_to_shelf(destination_shelf=None):
     label = "spPaint3d"
 
     buttons = cmds.shelfLayout(destination_shelf, query=True, childArray=True) or []
-    found = [b for b in buttons if
-             cmds.objectTypeUI(b, isType="shelfButton") and cmds.shelfButton(b, query=True, label=True) == label]
+    # one lsUI call to sort out the shelf buttons instead of an objectTypeUI query per child
+    shelf_buttons = set(cmds.lsUI(type="shelfButton") or [])
+    found = [b for b in buttons if b in shelf_buttons and cmds.shelfButton(b, query=True, label=True) == label]
 
     if found:
         logger.warning("Shelf button already exists! Removing the old button...")
@@ -131,7 +269,14 @@ def add_to_shelf(destination_shelf=None):
 
 
 def get_top_level_shelf():
-    return mel.eval("global string $gShelfTopLevel; $temp = $gShelfTopLevel;")
+    """
+    The shelf top level layout doesn't change once the Maya UI is built, the MEL global is only read once
+    :rtype: str
+    """
+    global _top_level_shelf
+    if not _top_level_shelf:
+        _top_level_shelf = mel.eval("global string $gShelfTopLevel; $temp = $gShelfTopLevel;")
+    return _top_level_shelf
 
 
 def add_to_current_shelf():
@@ -141,24 +286,32 @@ def add_to_current_shelf():
 
 
 def install_module(shelf_only=False):
+    # files may have been deleted or recreated since a previous drop in the same session
+    _stat_cache.clear()
     if not shelf_only:
         module_file_path = os.path.join(MODULE_PATH, MODULE_FILE_NAME)
-        if not os.path.exists(module_file_path):
+        if not _exists(module_file_path):
             logger.error("Installation aborted! Unable to locate the file: {0}".format(module_file_path))
             return False
 
         module_environment = os.environ.get(ENV_MAYA_MODULE_PATH, "")
 
         normalized_module_path = os.path.normcase(MODULE_PATH)
-        if any(p for p in module_environment.split(';') if os.path.normcase(p) == normalized_module_path):
+        existing_module_paths = set(os.path.normcase(p) for p in module_environment.split(';') if p)
+        if normalized_module_path in existing_module_paths:
             logger.warning(
                 "The {0} environment variable already contains the module path. Maya should be restarted and the module should be available...".format(
                     ENV_MAYA_MODULE_PATH))
             return False
 
-        logger.info("Copying the module to the user's documents folder...")
-        module_file_path = copy_module_to_user_folder(module_file_path)
-        logger.info("Module file successfully copied to: {0}".format(module_file_path))
+        destination_path = os.path.join(get_user_modules_folder(), MODULE_FILE_NAME)
+        if is_module_file_up_to_date(module_file_path, destination_path):
+            logger.info("Module file already up to date in: {0}".format(destination_path))
+            module_file_path = destination_path
+        else:
+            logger.info("Copying the module to the user's documents folder...")
+            module_file_path = copy_module_to_user_folder(module_file_path)
+            logger.info("Module file successfully copied to: {0}".format(module_file_path))
 
         logger.info("Loading module and adding the needed paths to the running environment...")
         cmds.loadModule(load=module_file_path)
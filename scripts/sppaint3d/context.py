@@ -36,6 +36,11 @@ sp3dUnit = {
     "ft": 0.0328084,
     "yd": 0.0109361, }
 
+# objects grouping modes stored in the group tool option (the optionVar is a float, comparing equal to these)
+sp3dGroupSession = 0  # single paint session group
+sp3dGroupStroke = 1  # stroke sorted groups
+sp3dGroupSource = 2  # source sorted groups
+
 sp3d_dbgfile = "C:\\sp3ddbg_log.txt"
 sp3d_dbg = False  # debug flag to log to file
 sp3d_log = False  # debug flag to log to script editor log
@@ -509,7 +514,7 @@ class paintContext(object):
 
         if self.uiValues.hierarchy:
             # grouping objects
-            if self.uiValues.group == 0.0:
+            if self.uiValues.group == sp3dGroupSession:
                 # single group sorting
                 groupName = self.uiValues.getGroupID()
                 for obj in self.strokeIntersectionList.intersectionList:
@@ -517,13 +522,13 @@ class paintContext(object):
                         groupName = cmds.group(empty=True, name=groupName)
                     cmds.parent(obj.generatedDAG, groupName, relative=True)
 
-            elif self.uiValues.group == 1.0:
+            elif self.uiValues.group == sp3dGroupStroke:
                 # stroke group sorting
                 groupName = cmds.group(empty=True, name='spPaint3dStrokeOutput')
                 for obj in self.strokeIntersectionList.intersectionList:
                     cmds.parent(obj.generatedDAG, groupName, relative=True)
 
-            elif self.uiValues.group == 2.0:
+            elif self.uiValues.group == sp3dGroupSource:
                 # source group sorting
                 for obj in self.strokeIntersectionList.intersectionList:
                     shapeParent = cmds.listRelatives(obj.dagMeshSourceObject, parent=True)
@@ -1069,19 +1074,19 @@ class placeContext(object):
         if self.uiValues.hierarchy:
             # grouping object
             # parenting the cursor object in the appropriate groupe
-            if self.uiValues.group == 0.0:
+            if self.uiValues.group == sp3dGroupSession:
                 # single group sorting
                 groupName = self.uiValues.getGroupID()
                 if not cmds.objExists(groupName):
                     groupName = cmds.group(empty=True, name=groupName)
                 cmds.parent(self.cursor.cursorDAG, groupName, relative=True)
 
-            elif self.uiValues.group == 1.0:
+            elif self.uiValues.group == sp3dGroupStroke:
                 # stroke group sorting
                 groupName = cmds.group(empty=True, name='spPaint3dStrokeOutput')
                 cmds.parent(self.cursor.cursorDAG, groupName, relative=True)
 
-            elif self.uiValues.group == 2.0:
+            elif self.uiValues.group == sp3dGroupSource:
                 # source group sorting
                 shapeParent = cmds.listRelatives(self.cursor.sourceDAG, parent=True)
                 groupName = 'spPaint3dOutput_' + shapeParent[0]
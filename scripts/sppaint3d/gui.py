@@ -13,10 +13,19 @@
 
 from __future__ import print_function
 
+import re
 import sys
+import bisect
 import random as rand
+from contextlib import contextmanager
+from functools import partial
 
 import maya.cmds as cmds
+try:
+    import maya.api.OpenMaya as om2
+except ImportError:
+    # the python API 2.0 is only available from Maya 2012, the callers fall back to maya.cmds without it
+    om2 = None
 
 import sppaint3d.context as context
 
@@ -25,8 +34,21 @@ spPaint3dGuiID_Height = 740
 spPaint3dSetupID = "spPaint3dSetup"
 spPaint3dVersion = 2022.0
 
+# memoized by getMayaVersion
+_mayaVersion = None
+# leading 4 digits year of the maya version strings returned by cmds.about
+_VERSION_RE = re.compile(r'(\d{4})')
+
+# depth of the nested suspendRefresh blocks
+_refreshDepth = 0
+
+# checkbox states sent by Maya meaning checked, bool since 2011 and a string before that
+_TRUTHY = frozenset((True, 'true', 'True', '1', 'on'))
+
 # debug to log some operation down to the script editor
 sp3d_log = False
+# read once at import, the callbacks only test this module constant
+SP3D_LOG = bool(sp3d_log)
 
 # optionVar name: (type, default value, corresponding class attribute)
 # For now the class methods only check for 'iv' and 'fv' types while looping stuff
@@ -53,11 +75,26 @@ sp3dOptionVars = {
     "sp3dVersion": ("fv", spPaint3dVersion, "version")
 }
 
+# ramp FX menu labels, their index is the corresponding rampFX option value (the blank label means no ramp effect)
+_RAMP_LABELS = (' ', 'rotate', 'scale', 'both')
+_RAMP_NAME_TO_ID = dict((name, rampid) for rampid, name in enumerate(_RAMP_LABELS) if rampid)
+_RAMP_ID_TO_NAME = dict((rampid, name) for name, rampid in _RAMP_NAME_TO_ID.items())
+
+# sp3dOptionVars entries split per type once at import, as (optionVar name, default value, class attribute)
+_IV_ITEMS = tuple((name, default, varname) for name, (vtype, default, varname) in sp3dOptionVars.items()
+                  if vtype == 'iv')
+_FV_ITEMS = tuple((name, default, varname) for name, (vtype, default, varname) in sp3dOptionVars.items()
+                  if vtype == 'fv')
+
 
 class sp3dToolOption(object):
     """
     Class to store all tool related data
     """
+    __slots__ = ('transformRotate', 'transformScale', 'transformScaleUniform', 'instance', 'random', 'align',
+                 'paintFlux', 'jitter', 'rampFX', 'realTimeRampFX', 'paintTimer', 'paintDistance', 'placeRotate',
+                 'continuousTransform', 'upOffset', 'preserveConn', 'smoothNormal', 'hierarchy', 'group', 'groupID',
+                 'version')
 
     def __init__(self):
         """
@@ -82,7 +119,7 @@ class sp3dToolOption(object):
         self.preserveConn = False
         self.smoothNormal = False  # false=decal mode, force pure normal from intersected triangle / true=smoothed normal per neighboring edges
         self.hierarchy = False  # False = no grouping of painted objects
-        self.group = 0  # float value so it doesnt get converted into boolean when I batch read the Vars / 0=single group / 1=stroke group / 2=source group
+        self.group = context.sp3dGroupSession  # float value so it doesnt get converted into boolean when I batch read the Vars / one of the context.sp3dGroup* modes
         self.groupID = None  # used to track the group name where to sort the generated objects from the paint strokes
         self.version = spPaint3dVersion  # used to allow tracking of potentially erroneous obsolete optionVars
 
@@ -91,9 +128,15 @@ class sp3dToolOption(object):
             self.loadVars()
         else:
             # seems there are issues with the optionVars and/or version mismatch
-            cmds.confirmDialog(title='Script options alert',
-                               message='It seems either the script is run for the first time or the version running is different than the saved data.\nAll options will be reseted to defaults!',
-                               button=['Whatever'])
+            # only notifying the user without blocking the tool launch
+            cmds.warning('spPaint3d: either the script is run for the first time or the version running is different than the saved data. All options will be reseted to defaults!')
+            if getMayaVersion() >= 2014:
+                cmds.inViewMessage(assistMessage='spPaint3d options reset to defaults', position='midCenter', fade=True)
+            else:
+                # no in-view message before Maya 2014, deferred so the dialog doesn't block the window being built
+                cmds.evalDeferred(partial(cmds.confirmDialog, title='Script options alert',
+                                          message='It seems either the script is run for the first time or the version running is different than the saved data.\nAll options will be reseted to defaults!',
+                                          button=['Whatever']))
 
             # also deleting the main & setup windows prefs to avoid size issues across versions
             if cmds.windowPref(spPaint3dSetupID, exists=True):
@@ -107,7 +150,13 @@ class sp3dToolOption(object):
         """
         print the value of all the tool option
         """
-        print(self.__dict__)
+        print(dict((varname, getattr(self, varname)) for varname in self.__slots__))
+
+    def snapshot(self):
+        """
+        return the current value of all the tool options as a tuple, used to detect changes
+        """
+        return tuple(getattr(self, varname) for varname in self.__slots__)
 
     def checkVars(self):
         """
@@ -115,51 +164,42 @@ class sp3dToolOption(object):
         Returns False if any issue is detected.
         Returns True if all conditions are met and the method runs its course.
         """
-        for name in sp3dOptionVars.keys():  # loop through all the optionVars from the global struct
-            info = sp3dOptionVars[name]
-            # iterating through all the currently valid optionVar names from the global struct, then fetching the stored value if it exists
-            type, value, varname = info
-            if not cmds.optionVar(exists=name):
-                # name isnt' an existing optionVar
-                return False
-            if name == 'sp3dVersion' and cmds.optionVar(q=name) != value:
-                # locally stored script version optionVar is obsolete
-                return False
-
-        # for loop exited before breaking, about to return True then
+        # fetching all the existing optionVar names at once rather than querying them one by one
+        existing = set(cmds.optionVar(list=True) or [])
+        if not existing.issuperset(sp3dOptionVars):
+            # at least one name from the global struct isnt' an existing optionVar
+            return False
+
+        if cmds.optionVar(q='sp3dVersion') != sp3dOptionVars['sp3dVersion'][1]:
+            # locally stored script version optionVar is obsolete
+            return False
+
+        # all checks passed, about to return True then
         return True
 
     def loadVars(self):
         """
         Will load the stored optionVars into self
         """
-        for name in sp3dOptionVars.keys():  # loop through all the optionVars from the global struct
-            info = sp3dOptionVars[name]
-            # iterating through all the currently valid optionVar names from the global struct, then fetching the stored value if it exists
-            type, value, varname = info
-            if type == 'iv':
-                # this is an int value to convert into bool
-                self.__dict__[varname] = bool(cmds.optionVar(q=name))
-            elif type == 'fv':
-                self.__dict__[varname] = round(cmds.optionVar(q=name), 2)
-
-        if sp3d_log:
+        # only called once checkVars found all the optionVars, or after resetVars wrote them all
+        optionVar = cmds.optionVar
+        for name, default, varname in _IV_ITEMS:
+            # this is an int value to convert into bool
+            setattr(self, varname, bool(optionVar(q=name)))
+        for name, default, varname in _FV_ITEMS:
+            # float values are already rounded when committed
+            setattr(self, varname, optionVar(q=name))
+
+        if SP3D_LOG:
             self.dumpVars()
 
     def resetVars(self):
         """
         Flush the values and restore default settings
         """
-        for name in sp3dOptionVars.keys():  # loop through all the optionVars from the global struct
-            info = sp3dOptionVars[name]
-            # iterating through all the currently valid optionVar names from the global struct, then fetching the stored value if it exists
-            type, value, varname = info
-            if type == 'iv':
-                # this is an int value to convert into bool
-                cmds.optionVar(iv=(name, value))
-            elif type == 'fv':
-                # float value default
-                cmds.optionVar(fv=(name, value))
+        # optionVar flags are multi-use, storing everything with a single command
+        cmds.optionVar(iv=[(name, default) for name, default, varname in _IV_ITEMS],
+                       fv=[(name, default) for name, default, varname in _FV_ITEMS])
 
         self.loadVars()
 
@@ -167,17 +207,11 @@ class sp3dToolOption(object):
         """
         Method to store the data from instance attributes into optionVars.
         """
-        for name in sp3dOptionVars.keys():  # force initialize optionVars to defaults
-            info = sp3dOptionVars[name]
-            type, value, varname = info
-            if type == 'iv':
-                # convert the bool attribute value into an int
-                # print int(self.__dict__[varname])
-                cmds.optionVar(iv=(name, int(self.__dict__[varname])))
-            elif type == 'fv':
-                # all other optionVar types
-                cmds.optionVar(fv=(name, self.__dict__[varname]))
-        if sp3d_log:
+        # bool attributes are stored as int and float ones rounded to 2 decimals
+        # optionVar flags are multi-use so storing everything with a single command
+        cmds.optionVar(iv=[(name, int(getattr(self, varname))) for name, default, varname in _IV_ITEMS],
+                       fv=[(name, round(getattr(self, varname), 2)) for name, default, varname in _FV_ITEMS])
+        if SP3D_LOG:
             self.dumpVars()
 
     def getGroupID(self):
@@ -204,35 +238,39 @@ class sp3dTransform(object):
         self.uJitter = uJitter
         self.vJitter = vJitter
 
+    def snapshot(self):
+        """
+        return the current transform bounds as a tuple, used to detect changes
+        """
+        return self.rotate, self.scale, self.uJitter, self.vJitter
+
     def getRandomRotate(self):
         """
         return a (x,y,z) tuple with properly randomized value between the self.rotate bounds
         """
-        x, y, z = self.rotate
-        randxyz = (round(rand.uniform(x[0], x[1]), 3),
-                   round(rand.uniform(y[0], y[1]), 3),
-                   round(rand.uniform(z[0], z[1]), 3))
-        return randxyz
+        u = rand.uniform
+        r = round
+        (x0, x1), (y0, y1), (z0, z1) = self.rotate
+        return r(u(x0, x1), 3), r(u(y0, y1), 3), r(u(z0, z1), 3)
 
     def getRandomScale(self, uniform):
         """
         return a (x,y,z) tuple with properly randomized value between the self.scale bounds
         """
-        x, y, z = self.scale
+        u = rand.uniform
+        r = round
+        (x0, x1), (y0, y1), (z0, z1) = self.scale
         if uniform:
-            randxyz = round(rand.uniform(x[0], x[1]), 3)
+            randxyz = r(u(x0, x1), 3)
             return randxyz, randxyz, randxyz
         else:
-            randxyz = (round(rand.uniform(x[0], x[1]), 3),
-                       round(rand.uniform(y[0], y[1]), 3),
-                       round(rand.uniform(z[0], z[1]), 3))
-            return randxyz
+            return r(u(x0, x1), 3), r(u(y0, y1), 3), r(u(z0, z1), 3)
 
     def getRandomJitter(self, space):
         """
         return a random value between the min and max from the corresponding space. space must be either 'uJitter' or 'vJitter'
         """
-        min, max = self.__dict__[space]
+        min, max = getattr(self, space)
         return round(rand.uniform(min, max), 3)
 
 
@@ -243,9 +281,9 @@ class sp3dObjectList(object):
     """
     # define the list of authorized object type used when adding objects to lists
     authType = {
-        'default': ('mesh',),
-        'source': ('mesh', 'locator',),
-        'target': ('mesh',)
+        'default': frozenset(('mesh',)),
+        'source': frozenset(('mesh', 'locator',)),
+        'target': frozenset(('mesh',))
     }
 
     def __init__(self, authorized='target', errorHandle=None):
@@ -256,6 +294,14 @@ class sp3dObjectList(object):
         """
         # TODO
         self.obj = {}  # dictionnary of entries
+        # parallel lists kept sorted by key, mirrors self.obj so the paint loop can pick entries without rebuilding lists
+        self._keys = []
+        self._dags = []
+        # running sums of the entries probabilities (inactive entries weigh 0), rebuilt lazily when the list changed
+        self._cum = []
+        self._total = 0
+        self._dirty = True
+        self._rev = 0  # incremented on every change of the entries, used to detect changes
         self.i = 0  # index values used if this is a source object list using sequential mode distribution
         self.auth = self.authType[authorized]  # used to sort 'valid' object when using the add method
         self.errorHandle = errorHandle
@@ -267,12 +313,21 @@ class sp3dObjectList(object):
         """
         if len(self.obj.keys()) == 0:
             return False  # list is empty
-        for obj in self.obj.keys():
-            data = self.obj[obj]
-            if self.errorHandle:
-                self.errorHandle.raiseError("INFO: validating object: %s", data[0])
-            if not cmds.objExists(data[0]):
-                return False
+        # an entry stored without a DAG path can't be used by the paint context
+        if not all(self._dags):
+            return False
+        if om2 is None:
+            for dag in self._dags:
+                if not cmds.objExists(dag):
+                    return False
+        else:
+            # adding a missing object to a selection list raises, way cheaper than an objExists call per object
+            sel = om2.MSelectionList()
+            for dag in self._dags:
+                try:
+                    sel.add(dag)
+                except RuntimeError:
+                    return False
         if self.errorHandle:
             self.errorHandle.raiseError("INFO: Everything checks out")
         return True
@@ -283,10 +338,7 @@ class sp3dObjectList(object):
         Return False if all objects are unique
         (In context: there can't be an object which is both a source object and a target surface)
         """
-        for obj in compareobjlist.obj.keys():
-            if self.alreadyExists(obj):
-                return True
-        return False
+        return not set(self.obj).isdisjoint(compareobjlist.obj)
 
     def alreadyExists(self, obj):
         """
@@ -314,11 +366,10 @@ class sp3dObjectList(object):
         else:
             # Determine if obj is valid, or if has valid children
             objtype = cmds.objectType(obj)
-            objchild = cmds.listRelatives(obj, children=True, shapes=True)  # get all the children shapes of the object
 
             if objtype in self.auth:
                 # a shape was selected and is part of the authorized object types for this list type. will use the shape's name as the key
-                self.obj[obj] = (getDAGPath(obj, True), activation, proba, align)
+                self._store(obj, (getDAGPath(obj, True, objtype), activation, proba, align))
                 return obj, True
             elif objtype == 'transform':
                 # a transform was selected and checking now what lies underneath it
@@ -327,18 +378,21 @@ class sp3dObjectList(object):
                 # if multiple shape of auth type, then the transform become the key
                 # target valid object =
                 # only 1 valid children of auth type
-                if objchild is None:
-                    # original object has no shapes among his 1st level children
+                # get the children shapes of the object, only the ones of an authorized type
+                objchild = cmds.listRelatives(obj, children=True, shapes=True, type=list(self.auth)) or []
+                if not objchild:
+                    # original object has no shapes of the proper type among his 1st level children
                     return None, "Object doesn't seem to have any direct child of the proper type"
-                elif len(objchild) == 1 and cmds.nodeType(objchild[0]) in self.auth:
-                    # obj(transform) has only one child, and is of a proper type for the list, return objchild[0] as the key
+                elif len(objchild) == 1:
+                    # obj(transform) has only one child of a proper type for the list, return objchild[0] as the key
+                    # getDAGPath would count the shapes of other types under the transform and return None, the path
+                    # comes from the same filtered query instead
+                    dag = cmds.listRelatives(obj, children=True, shapes=True, type=list(self.auth), fullPath=True)[0]
                     obj = objchild[0]
                     # now checking the only children and might already have been added
-                    if self.alreadyExists(obj):
+                    if not self._store(obj, (dag, activation, proba, align)):
                         return None, "Object already exists in the list and can't be added again"
-                    else:
-                        self.obj[obj] = (getDAGPath(obj, True), activation, proba, align)
-                        return obj, True
+                    return obj, True
                 # elif(len(objchild)>1):
                 # obj(transform) has multiple children and may be a group (or a mesh transform parenting other mesh)
                 # check if at least one of the children is of the appropriate type
@@ -352,6 +406,35 @@ class sp3dObjectList(object):
 
         # Never reach here
 
+    def _store(self, obj, data):
+        """
+        add the obj entry to self.obj and to the sorted parallel lists
+        return False if obj already was in the list, the existing entry is kept
+        """
+        if self.obj.setdefault(obj, data) is not data:
+            return False
+        index = bisect.bisect_left(self._keys, obj)
+        self._keys.insert(index, obj)
+        self._dags.insert(index, data[0])
+        self._dirty = True
+        self._rev += 1
+        return True
+
+    def _rebuildWeights(self):
+        """
+        rebuild the cumulative probabilities used by the weighted random pick
+        """
+        total = 0
+        cum = []
+        for key in self._keys:
+            data = self.obj[key]
+            if data[1]:
+                total += data[2]
+            cum.append(total)
+        self._cum = cum
+        self._total = total
+        self._dirty = False
+
     def printObj(self):
         """
         print the content of the dictionnary
@@ -368,12 +451,21 @@ class sp3dObjectList(object):
         # TODO: check if key really exists return False
         # TODO: delete the key:data and return True
         del self.obj[obj]
+        index = bisect.bisect_left(self._keys, obj)
+        del self._keys[index]
+        del self._dags[index]
+        self._dirty = True
+        self._rev += 1
 
     def clrObj(self):
         """
         empty the dictionnary
         """
         self.obj = {}
+        self._keys = []
+        self._dags = []
+        self._dirty = True
+        self._rev += 1
         self.i = 0
 
     def getRandom(self, weighted=False):
@@ -382,10 +474,15 @@ class sp3dObjectList(object):
         will return a weighted random entry using the proba attributes from each entry if the weighted boolean parameter is set
         will return None if the method was unsuccessful to retrieve the selected object (if object was deleted from the scene while the script was running for example)
         """
-        # TODO: implement weight and boolean flag
-        dkeys = list(self.obj.keys())
-        dag = self.obj[dkeys[rand.randint(0, len(dkeys) - 1)]]
-        return dag[0]
+        if weighted:
+            if self._dirty:
+                self._rebuildWeights()
+            if self._total > 0:
+                # bisect_right skips the entries weighing 0
+                index = bisect.bisect_right(self._cum, rand.random() * self._total)
+                return self._dags[min(index, len(self._dags) - 1)]
+        # TODO: implement boolean flag
+        return rand.choice(self._dags)
 
     def getNext(self):
         """
@@ -393,11 +490,9 @@ class sp3dObjectList(object):
         will return None if the method was unsuccessful to retrieve the selected object (if object was deleted from the scene while the script was running for example)
         """
         # TODO: implement boolean flag
-        dkeys = list(self.obj.keys())
-        dkeys.sort()
-        dag = self.obj[dkeys[self.i % len(dkeys)]]
+        dag = self._dags[self.i % len(self._dags)]
         self.i += 1
-        return dag[0]
+        return dag
 
 
 class sp3derror(object):
@@ -411,41 +506,77 @@ class sp3derror(object):
         """
         self.error = initerror
         self.ui = uifield
+        self.pending = False  # a deferred broadcast is already queued
         self.broadcastError()
 
     def broadcastError(self):
         """
         display the error in the proper field in the UI (self.uiInfoTextField)
         """
-        cmds.textField(self.ui, edit=True, text=self.error)
+        self.pending = False
+        if cmds.textField(self.ui, exists=True):
+            cmds.textField(self.ui, edit=True, text=self.error)
 
     def raiseError(self, newerror):
         """
         update the error and call out to display it in the main UI
+        the UI is updated once Maya is idle, successive errors raised meanwhile only trigger a single update
         """
+        if newerror == self.error:
+            return
         self.error = newerror
-        self.broadcastError()
+        if not self.pending:
+            self.pending = True
+            cmds.evalDeferred(self.broadcastError, lowestPriority=True)
 
 
 class spPaint3dWin(object):
     """
     Main UI window class definition
     """
+    # setup window control: (option attribute, True if the value is a checkbox state to convert)
+    # radio buttons callbacks are bound with the value of the option they select
+    setupOptions = {
+        'uiSetupNormalCol': ('smoothNormal', False),
+        'uiSetupFluxCol': ('paintFlux', False),
+        'uiSetupHierarchyGrp': ('group', False),
+        'uiSetupChkInputConn': ('preserveConn', True),
+        'uiSetupHierarchyActive': ('hierarchy', True),
+        'uiSetupRealTimeRampFX': ('realTimeRampFX', True),
+        'uiSetupContinuousTransform': ('continuousTransform', True)
+    }
+    # options displayed by the setup window, compared against the last values shown to only edit the changed controls
+    setupDisplayed = ('preserveConn', 'realTimeRampFX', 'smoothNormal', 'paintFlux', 'placeRotate',
+                      'continuousTransform', 'hierarchy', 'group')
 
     def __init__(self):
         # delete ui window if opened
-        if cmds.window(spPaint3dGuiID, exists=True):
-            cmds.deleteUI(spPaint3dGuiID)
+        deleteToolWindow(spPaint3dGuiID)
         # removing delete prefs to prevent issues when window is spawned outside of display on mac?
         # if cmds.windowPref(spPaint3dGuiID, exists=True):
         #     cmds.windowPref(spPaint3dGuiID, remove=True)
 
         # delete option window if opened
-        if cmds.window(spPaint3dSetupID, exists=True):
-            cmds.deleteUI(spPaint3dSetupID)
+        deleteToolWindow(spPaint3dSetupID)
 
         self.mayaVersion = getMayaVersion()
+        # converter for the checkbox states sent by Maya, a set lookup covers both the bool and the pre-2011 string states
+        self._toBool = _TRUTHY.__contains__
+
+        # building all the controls with the refresh suspended to avoid intermediate layout/redraw passes
+        with suspendRefresh():
+            self.buildWindow()
+
+        self.uiUpdatePaintDistanceUnit()
+        cmds.showWindow(self.uiWin)
+        self.resizeWindow('winui', spPaint3dGuiID_Height)  # force a resize to prevent some weird UI issue on mac
+        if SP3D_LOG:
+            self.debugFrameSize()  # display actual corrected ui frame sizes
 
+    def buildWindow(self):
+        """
+        Create the main window controls and the tool data they're bound to
+        """
         self.uiWin = cmds.window(spPaint3dGuiID, title=("spPaint3d | " + str(spPaint3dVersion)), width=255,
                                  resizeToFitChildren=True, sizeable=True, titleBar=True, minimizeButton=False,
                                  maximizeButton=False, menuBar=False, menuBarVisible=False, toolbox=True)
@@ -456,9 +587,9 @@ class spPaint3dWin(object):
         # Top buttons
         # ----------------------
         self.uiTopForm = cmds.formLayout(numberOfDivisions=100)
-        self.uiBtnHelp = cmds.button(label='Help', command=lambda *args: self.uiButtonCallback("uiBtnHelp", args))
+        self.uiBtnHelp = cmds.button(label='Help', command=partial(self.uiButtonCallback, "uiBtnHelp"))
         self.uiBtnOptions = cmds.button(label='Options',
-                                        command=lambda *args: self.uiButtonCallback("uiBtnOptions", args))
+                                        command=partial(self.uiButtonCallback, "uiBtnOptions"))
 
         cmds.formLayout(self.uiTopForm, edit=True, attachControl=[(self.uiBtnOptions, 'left', 5, self.uiBtnHelp)])
 
@@ -468,25 +599,25 @@ class spPaint3dWin(object):
         # Source Frame
         # ----------------------
         self.uiSourceFrame = cmds.frameLayout(label='Brush Geometry', collapsable=True,
-                                              collapseCommand=lambda: self.resizeWindow('collapse', 109),
-                                              expandCommand=lambda: self.resizeWindow('expand', 109), mh=5, mw=5)
+                                              collapseCommand=partial(self.resizeWindow, 'collapse', 109),
+                                              expandCommand=partial(self.resizeWindow, 'expand', 109), mh=5, mw=5)
         self.uiSourceForm = cmds.formLayout(numberOfDivisions=100, width=255)
         self.uiSourceList = cmds.textScrollList(numberOfRows=5, allowMultiSelection=True, width=215)
+        self.uiSourceBtnRow = cmds.rowLayout(numberOfColumns=3, columnWidth3=(60, 65, 65), columnOffset3=(0, 5, 5),
+                                             columnAttach3=('left', 'left', 'left'))
         self.uiSourceBtnAdd = cmds.symbolButton(w=60, h=18, ann='Add selected object(s) to the list',
                                                 image='sp3dadd.xpm',
-                                                command=lambda *args: self.uiListCallback("add", "uiSourceList"))
+                                                command=partial(self.uiListCallback, "add", "uiSourceList"))
         self.uiSourceBtnRem = cmds.symbolButton(w=60, h=18, ann='Remove selected object(s) from the list',
                                                 image='sp3drem.xpm',
-                                                command=lambda *args: self.uiListCallback("rem", "uiSourceList"))
+                                                command=partial(self.uiListCallback, "rem", "uiSourceList"))
         self.uiSourceBtnClr = cmds.symbolButton(w=60, h=18, ann='Clear the list', image='sp3dclr.xpm',
-                                                command=lambda *args: self.uiListCallback("clr", "uiSourceList"))
+                                                command=partial(self.uiListCallback, "clr", "uiSourceList"))
+
+        cmds.setParent(self.uiSourceForm)
 
         cmds.formLayout(self.uiSourceForm, edit=True, attachForm=[(self.uiSourceList, 'top', 0)],
-                        attachControl=[(self.uiSourceBtnAdd, 'top', 3, self.uiSourceList),
-                                       (self.uiSourceBtnRem, 'left', 5, self.uiSourceBtnAdd),
-                                       (self.uiSourceBtnRem, 'top', 3, self.uiSourceList),
-                                       (self.uiSourceBtnClr, 'left', 5, self.uiSourceBtnRem),
-                                       (self.uiSourceBtnClr, 'top', 3, self.uiSourceList)])
+                        attachControl=[(self.uiSourceBtnRow, 'top', 3, self.uiSourceList)])
 
         cmds.setParent(self.uiTopColumn)
 
@@ -494,46 +625,50 @@ class spPaint3dWin(object):
         # Transform Setup
         # ----------------------
         self.uiTransformFrame = cmds.frameLayout(label='Transform Setup', collapsable=True,
-                                                 collapseCommand=lambda: self.resizeWindow('collapse', 177),
-                                                 expandCommand=lambda: self.resizeWindow('expand', 177), mh=5, mw=5)
+                                                 collapseCommand=partial(self.resizeWindow, 'collapse', 177),
+                                                 expandCommand=partial(self.resizeWindow, 'expand', 177), mh=5, mw=5)
         self.uiTransformForm = cmds.formLayout(numberOfDivisions=100, width=255)
         self.uiTransformRotateCheck = cmds.checkBox(label='Rotate', ann='Activate the rotate transform while painting',
-                                                    changeCommand=lambda *args: self.uiCheckBoxCallback(
-                                                        "transformRotate", args))
+                                                    changeCommand=partial(self.uiCheckBoxCallback, "transformRotate"))
         self.uiTransformRotateFieldX = cmds.floatFieldGrp(numberOfFields=2, label='Min', backgroundColor=(.81, .24, 0),
                                                           extraLabel='Max', cw4=(22, 50, 50, 30), precision=2,
                                                           ct4=('right', 'both', 'both', 'right'), co4=(2, 2, 2, 8),
-                                                          changeCommand=lambda *args: self.uiTransformCallback())
+                                                          changeCommand=partial(self.uiTransformCallback, "rotate", 0,
+                                                                                "uiTransformRotateFieldX"))
         self.uiTransformRotateFieldY = cmds.floatFieldGrp(numberOfFields=2, label='', backgroundColor=(.41, .75, 0),
                                                           extraLabel='', cw4=(22, 50, 50, 30), precision=2,
                                                           ct4=('right', 'both', 'both', 'right'), co4=(2, 2, 2, 8),
-                                                          changeCommand=lambda *args: self.uiTransformCallback())
+                                                          changeCommand=partial(self.uiTransformCallback, "rotate", 1,
+                                                                                "uiTransformRotateFieldY"))
         self.uiTransformRotateFieldZ = cmds.floatFieldGrp(numberOfFields=2, label='', backgroundColor=(.17, .4, .63),
                                                           extraLabel='', cw4=(22, 50, 50, 30), precision=2,
                                                           ct4=('right', 'both', 'both', 'right'), co4=(2, 2, 2, 8),
-                                                          changeCommand=lambda *args: self.uiTransformCallback())
+                                                          changeCommand=partial(self.uiTransformCallback, "rotate", 2,
+                                                                                "uiTransformRotateFieldZ"))
         self.uiTransformSeparator = cmds.separator(height=5, width=250, style='in')
         self.uiTransformScaleCheck = cmds.checkBox(label='Scale', ann='Activate the scale transform while painting',
-                                                   changeCommand=lambda *args: self.uiCheckBoxCallback("transformScale",
-                                                                                                       args))
+                                                   changeCommand=partial(self.uiCheckBoxCallback, "transformScale"))
         self.uiTransformScaleUniformCheck = cmds.checkBox(label='Uniform', ann='Force uniform scale while painting',
-                                                          changeCommand=lambda *args: self.uiCheckBoxCallback(
-                                                              "transformScaleUniform", args))
+                                                          changeCommand=partial(self.uiCheckBoxCallback,
+                                                                                "transformScaleUniform"))
         self.uiTransformScaleFieldX = cmds.floatFieldGrp(numberOfFields=2, label='Min', backgroundColor=(.81, .24, 0),
                                                          extraLabel='Max', cw4=(22, 50, 50, 30), precision=2,
                                                          ct4=('right', 'both', 'both', 'right'), co4=(2, 2, 2, 8),
                                                          v1=1.0, v2=1.0,
-                                                         changeCommand=lambda *args: self.uiTransformCallback())
+                                                         changeCommand=partial(self.uiTransformCallback, "scale", 0,
+                                                                               "uiTransformScaleFieldX"))
         self.uiTransformScaleFieldY = cmds.floatFieldGrp(numberOfFields=2, label='', backgroundColor=(.41, .75, 0),
                                                          extraLabel='', cw4=(22, 50, 50, 30), precision=2,
                                                          ct4=('right', 'both', 'both', 'right'), co4=(2, 2, 2, 8),
                                                          v1=1.0, v2=1.0,
-                                                         changeCommand=lambda *args: self.uiTransformCallback())
+                                                         changeCommand=partial(self.uiTransformCallback, "scale", 1,
+                                                                               "uiTransformScaleFieldY"))
         self.uiTransformScaleFieldZ = cmds.floatFieldGrp(numberOfFields=2, label='', backgroundColor=(.17, .4, .63),
                                                          extraLabel='', cw4=(22, 50, 50, 30), precision=2,
                                                          ct4=('right', 'both', 'both', 'right'), co4=(2, 2, 2, 8),
                                                          v1=1.0, v2=1.0,
-                                                         changeCommand=lambda *args: self.uiTransformCallback())
+                                                         changeCommand=partial(self.uiTransformCallback, "scale", 2,
+                                                                               "uiTransformScaleFieldZ"))
 
         cmds.formLayout(self.uiTransformForm, edit=True,
                         attachForm=[(self.uiTransformRotateCheck, 'top', 4), (self.uiTransformRotateFieldX, 'top', 0)],
@@ -560,25 +695,25 @@ class spPaint3dWin(object):
         # Target Surface(s)
         # ----------------------
         self.uiTargetFrame = cmds.frameLayout(label='Target Surface(s)', collapsable=True,
-                                              collapseCommand=lambda: self.resizeWindow('collapse', 109),
-                                              expandCommand=lambda: self.resizeWindow('expand', 109), mh=5, mw=5)
+                                              collapseCommand=partial(self.resizeWindow, 'collapse', 109),
+                                              expandCommand=partial(self.resizeWindow, 'expand', 109), mh=5, mw=5)
         self.uiTargetForm = cmds.formLayout(numberOfDivisions=100, width=255)
         self.uiTargetList = cmds.textScrollList(numberOfRows=5, allowMultiSelection=True, width=215)
+        self.uiTargetBtnRow = cmds.rowLayout(numberOfColumns=3, columnWidth3=(60, 65, 65), columnOffset3=(0, 5, 5),
+                                             columnAttach3=('left', 'left', 'left'))
         self.uiTargetBtnAdd = cmds.symbolButton(w=60, h=18, ann='Add selected object(s) to the list',
                                                 image='sp3dadd.xpm',
-                                                command=lambda *args: self.uiListCallback("add", "uiTargetList"))
+                                                command=partial(self.uiListCallback, "add", "uiTargetList"))
         self.uiTargetBtnRem = cmds.symbolButton(w=60, h=18, ann='Remove selected object(s) from the list',
                                                 image='sp3drem.xpm',
-                                                command=lambda *args: self.uiListCallback("rem", "uiTargetList"))
+                                                command=partial(self.uiListCallback, "rem", "uiTargetList"))
         self.uiTargetBtnClr = cmds.symbolButton(w=60, h=18, ann='Clear the list', image='sp3dclr.xpm',
-                                                command=lambda *args: self.uiListCallback("clr", "uiTargetList"))
+                                                command=partial(self.uiListCallback, "clr", "uiTargetList"))
+
+        cmds.setParent(self.uiTargetForm)
 
         cmds.formLayout(self.uiTargetForm, edit=True, attachForm=[(self.uiTargetList, 'top', 0)],
-                        attachControl=[(self.uiTargetBtnAdd, 'top', 3, self.uiTargetList),
-                                       (self.uiTargetBtnRem, 'left', 5, self.uiTargetBtnAdd),
-                                       (self.uiTargetBtnRem, 'top', 3, self.uiTargetList),
-                                       (self.uiTargetBtnClr, 'left', 5, self.uiTargetBtnRem),
-                                       (self.uiTargetBtnClr, 'top', 3, self.uiTargetList)])
+                        attachControl=[(self.uiTargetBtnRow, 'top', 3, self.uiTargetList)])
 
         cmds.setParent(self.uiTopColumn)
 
@@ -586,22 +721,22 @@ class spPaint3dWin(object):
         # Paint Contexts
         # ----------------------
         self.uiPaintFrame = cmds.frameLayout(label='Paint', collapsable=True,
-                                             collapseCommand=lambda: self.resizeWindow('collapse', 61),
-                                             expandCommand=lambda: self.resizeWindow('expand', 61), mh=5, mw=5)
+                                             collapseCommand=partial(self.resizeWindow, 'collapse', 61),
+                                             expandCommand=partial(self.resizeWindow, 'expand', 61), mh=5, mw=5)
         self.uiPaintForm = cmds.formLayout(numberOfDivisions=100, width=255)
         self.uiPaintDupSCB = cmds.symbolCheckBox(w=52, h=18, ann='Duplicate: Instance or Copy', ofi='sp3dduplicate.xpm',
                                                  oni='sp3dinstance.xpm',
-                                                 changeCommand=lambda *args: self.uiCheckBoxCallback("instance", args))
+                                                 changeCommand=partial(self.uiCheckBoxCallback, "instance"))
         self.uiPaintRandSCB = cmds.symbolCheckBox(w=52, h=18, ann='Object distribution: Random or Sequential',
                                                   ofi='sp3dsequence.xpm', oni='sp3drandom.xpm',
-                                                  changeCommand=lambda *args: self.uiCheckBoxCallback("random", args))
+                                                  changeCommand=partial(self.uiCheckBoxCallback, "random"))
         self.uiPaintAlignSCB = cmds.symbolCheckBox(w=100, h=18, ann='Align generated objects to the target surface',
                                                    ofi='sp3dalignoff.xpm', oni='sp3dalign.xpm',
-                                                   changeCommand=lambda *args: self.uiCheckBoxCallback("align", args))
+                                                   changeCommand=partial(self.uiCheckBoxCallback, "align"))
         self.uiPaintCtxBtn = cmds.symbolButton(w=105, h=28, ann='Paint', image='sp3dpaint.xpm',
-                                               command=lambda *args: self.genericContextCallback("PaintCtx"))
+                                               command=partial(self.genericContextCallback, "PaintCtx"))
         self.uiPlaceCtxBtn = cmds.symbolButton(w=105, h=28, ann='Place', image='sp3dplace.xpm',
-                                               command=lambda *args: self.genericContextCallback("PlaceCtx"))
+                                               command=partial(self.genericContextCallback, "PlaceCtx"))
 
         cmds.formLayout(self.uiPaintForm, edit=True,
                         attachForm=[(self.uiPaintDupSCB, 'top', 0)],
@@ -617,40 +752,38 @@ class spPaint3dWin(object):
         # Paint Metrics
         # ----------------------
         self.uiPaintMetricsFrame = cmds.frameLayout(label='Paint Options', collapsable=True,
-                                                    collapseCommand=lambda: self.resizeWindow('collapse', 129),
-                                                    expandCommand=lambda: self.resizeWindow('expand', 129), mh=5, mw=5)
+                                                    collapseCommand=partial(self.resizeWindow, 'collapse', 129),
+                                                    expandCommand=partial(self.resizeWindow, 'expand', 129), mh=5, mw=5)
         self.uiPaintMetricsForm = cmds.formLayout(numberOfDivisions=100, width=255)
         self.uiPaintTimer = cmds.floatSliderGrp(label='Sensibility', field=1, minValue=0.0, maxValue=0.2,
                                                 fieldMaxValue=1.0, precision=2, vis=False, w=250, cw=[(1, 55), (2, 35)],
-                                                changeCommand=lambda *args: self.uiFluxCallback("paintTimer", args),
+                                                changeCommand=partial(self.uiFluxCallback, "paintTimer"),
                                                 extraLabel='(interval in second)')
         self.uiPaintDistance = cmds.floatFieldGrp(label='Distance threshold', precision=2, vis=False, w=250,
                                                   cw=[(1, 100), (2, 50)],
-                                                  changeCommand=lambda *args: self.uiFluxCallback("paintDistance",
-                                                                                                  args),
+                                                  changeCommand=partial(self.uiFluxCallback, "paintDistance"),
                                                   extraLabel='')
         self.uiPaintMetricsSep1 = cmds.separator(w=250)
         self.uiUpOffset = cmds.floatFieldGrp(label='Up Offset', precision=2, vis=True, w=100, cw=[(1, 54), (2, 40)],
-                                             changeCommand=lambda *args: self.uiPaintOffsetCallback("upOffset", args))
+                                             changeCommand=partial(self.uiPaintOffsetCallback, "upOffset"))
         self.uiPaintMetricsRampMenu = cmds.optionMenu(l='Ramp FX',
-                                                      changeCommand=lambda *args: self.uiRampMenuCallback("rampMenu",
-                                                                                                          args))
-        cmds.menuItem(label=' ')
-        cmds.menuItem(label='rotate')
-        cmds.menuItem(label='scale')
-        cmds.menuItem(label='both')
+                                                      changeCommand=partial(self.uiRampMenuCallback, "rampMenu"))
+        for label in _RAMP_LABELS:
+            cmds.menuItem(label=label)
         self.uiPaintMetricsSep2 = cmds.separator(w=250)
 
         self.uiJitterCheck = cmds.checkBox(label='Jitter', ann='Activate jitter transform along U & V while painting',
-                                           changeCommand=lambda *args: self.uiCheckBoxCallback("jitter", args))
+                                           changeCommand=partial(self.uiCheckBoxCallback, "jitter"))
         self.uiJitterFieldU = cmds.floatFieldGrp(numberOfFields=2, label='Min U', backgroundColor=(.895, .735, 0.176),
                                                  extraLabel='Max', cw4=(32, 50, 50, 30), precision=2,
                                                  ct4=('right', 'both', 'both', 'right'), co4=(2, 2, 2, 8),
-                                                 changeCommand=lambda *args: self.uiTransformCallback())
+                                                 changeCommand=partial(self.uiTransformCallback, "uJitter", None,
+                                                                       "uiJitterFieldU"))
         self.uiJitterFieldV = cmds.floatFieldGrp(numberOfFields=2, label='Min V', backgroundColor=(.692, .323, 0.851),
                                                  extraLabel='', cw4=(32, 50, 50, 30), precision=2,
                                                  ct4=('right', 'both', 'both', 'right'), co4=(2, 2, 2, 8),
-                                                 changeCommand=lambda *args: self.uiTransformCallback())
+                                                 changeCommand=partial(self.uiTransformCallback, "vJitter", None,
+                                                                       "uiJitterFieldV"))
 
         cmds.formLayout(self.uiPaintMetricsForm, edit=True,
                         attachForm=[
@@ -664,15 +797,13 @@ class spPaint3dWin(object):
                             (self.uiPaintMetricsRampMenu, 'top', 6, self.uiPaintMetricsSep1),
                             (self.uiPaintMetricsRampMenu, 'left', 10, self.uiUpOffset),
                             (self.uiPaintMetricsSep2, 'top', 5, self.uiUpOffset),
+                            (self.uiJitterCheck, 'top', 5, self.uiPaintMetricsSep2),
+                            (self.uiJitterFieldU, 'left', 5, self.uiJitterCheck),
+                            (self.uiJitterFieldU, 'top', 5, self.uiPaintMetricsSep2),
+                            (self.uiJitterFieldV, 'top', 5, self.uiJitterFieldU),
+                            (self.uiJitterFieldV, 'left', 5, self.uiJitterCheck),
                         ])
 
-        cmds.formLayout(self.uiPaintMetricsForm, edit=True,
-                        attachControl=[(self.uiJitterCheck, 'top', 5, self.uiPaintMetricsSep2),
-                                       (self.uiJitterFieldU, 'left', 5, self.uiJitterCheck),
-                                       (self.uiJitterFieldU, 'top', 5, self.uiPaintMetricsSep2),
-                                       (self.uiJitterFieldV, 'top', 5, self.uiJitterFieldU),
-                                       (self.uiJitterFieldV, 'left', 5, self.uiJitterCheck)])
-
         cmds.setParent(self.uiTopColumn)
 
         # ----------------------
@@ -686,6 +817,8 @@ class spPaint3dWin(object):
         # ----------------------
         # Update UI controls
         # ----------------------
+        # flux control currently attached at the top of the paint metrics form, both are attached when building it
+        self.uiFluxControl = None
         self.uiValues = sp3dToolOption()
         self.updateUIControls(self.uiValues)
 
@@ -699,52 +832,55 @@ class spPaint3dWin(object):
         # Context tracking
         # ----------------------
         self.ctx = None
+        # state last passed to the running context, updateCtx skips the update when nothing changed since
+        self._ctxState = None
+        # depth of the nested _batchUpdates blocks, updateCtx is held back while it's not 0
+        self._batching = 0
 
-        self.uiUpdatePaintDistanceUnit()
-        cmds.showWindow(self.uiWin)
-        self.resizeWindow('winui', spPaint3dGuiID_Height)  # force a resize to prevent some weird UI issue on mac
-        if sp3d_log:
-            self.debugFrameSize()  # display actual corrected ui frame sizes
+        # set while an idle commit of the options is scheduled
+        self._commitPending = False
+
+        # linear unit currently displayed next to the paint distance field, the label follows any unit change
+        self._lastUnit = None
+        cmds.scriptJob(event=['linearUnitChanged', self.uiUpdatePaintDistanceUnit], parent=self.uiWin)
 
     def uiUpdatePaintDistanceUnit(self):
+        """
+        display the current linear unit next to the paint distance field, the control is only edited if it changed
+        """
         unit = cmds.currentUnit(query=True, linear=True)
+        if unit == self._lastUnit:
+            return
+        self._lastUnit = unit
         cmds.floatFieldGrp(self.uiPaintDistance, edit=True, extraLabel=unit)
 
     def uiTransformCallback(self, *args):
         """
-        rebuild the transform combo tuple and feed the class when changed in the UI
-        """
-        rotate = ((cmds.floatFieldGrp(self.uiTransformRotateFieldX, q=True, v1=True),
-                   cmds.floatFieldGrp(self.uiTransformRotateFieldX, q=True, v2=True)), (
-                      cmds.floatFieldGrp(self.uiTransformRotateFieldY, q=True, v1=True),
-                      cmds.floatFieldGrp(self.uiTransformRotateFieldY, q=True, v2=True)), (
-                      cmds.floatFieldGrp(self.uiTransformRotateFieldZ, q=True, v1=True),
-                      cmds.floatFieldGrp(self.uiTransformRotateFieldZ, q=True, v2=True)))
-        scale = ((cmds.floatFieldGrp(self.uiTransformScaleFieldX, q=True, v1=True),
-                  cmds.floatFieldGrp(self.uiTransformScaleFieldX, q=True, v2=True)), (
-                     cmds.floatFieldGrp(self.uiTransformScaleFieldY, q=True, v1=True),
-                     cmds.floatFieldGrp(self.uiTransformScaleFieldY, q=True, v2=True)), (
-                     cmds.floatFieldGrp(self.uiTransformScaleFieldZ, q=True, v1=True),
-                     cmds.floatFieldGrp(self.uiTransformScaleFieldZ, q=True, v2=True)))
-        uJitter = (cmds.floatFieldGrp(self.uiJitterFieldU, q=True, v1=True),
-                   cmds.floatFieldGrp(self.uiJitterFieldU, q=True, v2=True))
-        vJitter = (cmds.floatFieldGrp(self.uiJitterFieldV, q=True, v1=True),
-                   cmds.floatFieldGrp(self.uiJitterFieldV, q=True, v2=True))
-        self.transform = sp3dTransform(rotate, scale, uJitter, vJitter)
+        update the transform bound changed in the UI and feed the class
+        INPUT: [transform attribute, axis index (None for jitter), floatFieldGrp control attribute, values sent by Maya...]
+        """
+        attr, axis, control = args[:3]
+        values = args[3:]
+        if len(values) >= 2:
+            bounds = (float(values[0]), float(values[1]))
+        else:
+            # Maya didn't send both fields values, reading them back from the control
+            # a single value query returns all the fields at once
+            bounds = tuple(cmds.floatFieldGrp(getattr(self, control), q=True, value=True)[:2])
+        if axis is None:
+            setattr(self.transform, attr, bounds)
+        else:
+            axes = list(getattr(self.transform, attr))
+            axes[axis] = bounds
+            setattr(self.transform, attr, tuple(axes))
         self.updateCtx()
 
     def uiRampMenuCallback(self, *args):
         """
         ramp effect menu stuff
         """
-        if args[1][0] == 'rotate':
-            self.uiValues.rampFX = 1
-        elif args[1][0] == 'scale':
-            self.uiValues.rampFX = 2
-        elif args[1][0] == 'both':
-            self.uiValues.rampFX = 3
-        else:
-            self.uiValues.rampFX = 0
+        # the blank menu item means no ramp effect
+        self.uiValues.rampFX = _RAMP_NAME_TO_ID.get(args[1], 0)
         self.uiValues.commitVars()
         self.updateCtx()
 
@@ -753,35 +889,53 @@ class spPaint3dWin(object):
         reset transform values and update UI
         """
         self.transform = sp3dTransform()
-        cmds.floatFieldGrp(self.uiTransformRotateFieldX, e=True, v1=0, v2=0)
-        cmds.floatFieldGrp(self.uiTransformRotateFieldY, e=True, v1=0, v2=0)
-        cmds.floatFieldGrp(self.uiTransformRotateFieldZ, e=True, v1=0, v2=0)
-        cmds.floatFieldGrp(self.uiTransformScaleFieldX, e=True, v1=1, v2=1)
-        cmds.floatFieldGrp(self.uiTransformScaleFieldY, e=True, v1=1, v2=1)
-        cmds.floatFieldGrp(self.uiTransformScaleFieldZ, e=True, v1=1, v2=1)
-
-        cmds.floatFieldGrp(self.uiJitterFieldU, e=True, v1=0, v2=0)
-        cmds.floatFieldGrp(self.uiJitterFieldV, e=True, v1=0, v2=0)
+        resets = ((self.uiTransformRotateFieldX, 0), (self.uiTransformRotateFieldY, 0),
+                  (self.uiTransformRotateFieldZ, 0), (self.uiTransformScaleFieldX, 1),
+                  (self.uiTransformScaleFieldY, 1), (self.uiTransformScaleFieldZ, 1),
+                  (self.uiJitterFieldU, 0), (self.uiJitterFieldV, 0))
+        floatFieldGrp = cmds.floatFieldGrp
+        # edits made from script don't fire the fields changeCommand, the batch only defers the explicit updateCtx
+        # run on its exit, so a reset from resetOptions pushes the new transform to the context a single time
+        with self._batchUpdates():
+            with noUndo():
+                for control, value in resets:
+                    # both bounds are reset to the same value
+                    floatFieldGrp(control, e=True, v1=value, v2=value)
 
     def uiFluxCallback(self, *args):
         """
         Callback for timer slider and distance float field change
-        INPUT: [variable name, (value to update,)]
+        INPUT: [variable name, value to update]
         """
-        self.uiValues.__dict__[args[0]] = float(args[1][0])
-        self.uiValues.commitVars()
+        setattr(self.uiValues, args[0], float(args[1]))
+        self._scheduleCommit()
         self.uiUpdatePaintDistanceUnit()
         self.updateCtx()
 
     def uiPaintOffsetCallback(self, *args):
         """
         Callback for paint Offset field change
-        INPUT: [variable name, (value to update,)]
+        INPUT: [variable name, value to update]
         """
-        self.uiValues.__dict__[args[0]] = float(args[1][0])
-        self.uiValues.commitVars()
+        setattr(self.uiValues, args[0], float(args[1]))
+        self._scheduleCommit()
         self.updateCtx()
 
+    def _scheduleCommit(self):
+        """
+        Store the options once Maya gets idle, a slider drag sends many change events that only need a single commit
+        """
+        if not self._commitPending:
+            self._commitPending = True
+            cmds.scriptJob(idleEvent=self._flushCommit, runOnce=True)
+
+    def _flushCommit(self):
+        """
+        Run by the idle scriptJob scheduled from _scheduleCommit
+        """
+        self._commitPending = False
+        self.uiValues.commitVars()
+
     def uiButtonCallback(self, *args):
         """
         Callback for top buttons
@@ -798,11 +952,10 @@ class spPaint3dWin(object):
     def uiCheckBoxCallback(self, *args):
         """
         Callback for checkbox and symbolCheckbox
-        INPUT: [variable name, (string value for bool state,)]
+        INPUT: [variable name, string value for bool state]
         """
-        if sp3d_log:
-            print('input from UI: %s of type %s' % (args, args[1][0].__class__))
-        self.uiValues.__dict__[args[0]] = getBoolFromMayaControl(args[1][0], self.mayaVersion)
+        _dbg('input from UI: %s of type %s', args, args[1].__class__)
+        setattr(self.uiValues, args[0], self._toBool(args[1]))
         self.uiValues.commitVars()
         self.updateCtx()
 
@@ -810,34 +963,37 @@ class spPaint3dWin(object):
         """
         Will update the self ui controls with the values stores in the passed instance object
         """
-        cmds.checkBox(self.uiTransformRotateCheck, edit=True, value=ui.transformRotate)
-        cmds.checkBox(self.uiTransformScaleCheck, edit=True, value=ui.transformScale)
-        cmds.checkBox(self.uiTransformScaleUniformCheck, edit=True, value=ui.transformScaleUniform)
-        cmds.checkBox(self.uiJitterCheck, edit=True, value=ui.jitter)
-        cmds.symbolCheckBox(self.uiPaintDupSCB, edit=True, value=ui.instance)
-        cmds.symbolCheckBox(self.uiPaintRandSCB, edit=True, value=ui.random)
-        cmds.symbolCheckBox(self.uiPaintAlignSCB, edit=True, value=ui.align)
-
-        # toggling the proper paint flux control
-        cmds.floatSliderGrp(self.uiPaintTimer, edit=True, visible=(not ui.paintFlux), value=ui.paintTimer)
-        cmds.floatFieldGrp(self.uiPaintDistance, edit=True, visible=ui.paintFlux, v1=ui.paintDistance)
-
-        visible_control = self.uiPaintDistance if ui.paintFlux else self.uiPaintTimer
-        cmds.formLayout(self.uiPaintMetricsForm, edit=True,
-                        attachForm=[(visible_control, 'top', 0), ],
-                        attachControl=[(self.uiPaintMetricsSep1, 'top', 5, visible_control), ])
-
-        # feeding place rotate threshold
-        cmds.floatFieldGrp(self.uiUpOffset, edit=True, visible=True, v1=ui.upOffset)
-
-        if ui.rampFX == 1:
-            cmds.optionMenu(self.uiPaintMetricsRampMenu, edit=True, value='rotate')
-        elif ui.rampFX == 2:
-            cmds.optionMenu(self.uiPaintMetricsRampMenu, edit=True, value='scale')
-        elif ui.rampFX == 3:
-            cmds.optionMenu(self.uiPaintMetricsRampMenu, edit=True, value='both')
-        else:
-            cmds.optionMenu(self.uiPaintMetricsRampMenu, edit=True, value=' ')
+        # local bindings for the commands called several times below
+        checkBox = cmds.checkBox
+        symbolCheckBox = cmds.symbolCheckBox
+        floatFieldGrp = cmds.floatFieldGrp
+        # UI edits have no meaning for the user undo queue, and are all laid out once the refresh resumes
+        with noUndo(), suspendRefresh():
+            checkBox(self.uiTransformRotateCheck, edit=True, value=ui.transformRotate)
+            checkBox(self.uiTransformScaleCheck, edit=True, value=ui.transformScale)
+            checkBox(self.uiTransformScaleUniformCheck, edit=True, value=ui.transformScaleUniform)
+            checkBox(self.uiJitterCheck, edit=True, value=ui.jitter)
+            symbolCheckBox(self.uiPaintDupSCB, edit=True, value=ui.instance)
+            symbolCheckBox(self.uiPaintRandSCB, edit=True, value=ui.random)
+            symbolCheckBox(self.uiPaintAlignSCB, edit=True, value=ui.align)
+
+            # toggling the proper paint flux control
+            cmds.floatSliderGrp(self.uiPaintTimer, edit=True, visible=(not ui.paintFlux), value=ui.paintTimer)
+            floatFieldGrp(self.uiPaintDistance, edit=True, visible=ui.paintFlux, v1=ui.paintDistance)
+
+            visible_control = self.uiPaintDistance if ui.paintFlux else self.uiPaintTimer
+            if visible_control != self.uiFluxControl:
+                # only re-attaching the form when the visible flux control changed
+                self.uiFluxControl = visible_control
+                cmds.formLayout(self.uiPaintMetricsForm, edit=True,
+                                attachForm=[(visible_control, 'top', 0), ],
+                                attachControl=[(self.uiPaintMetricsSep1, 'top', 5, visible_control), ])
+
+            # feeding place rotate threshold
+            floatFieldGrp(self.uiUpOffset, edit=True, visible=True, v1=ui.upOffset)
+
+            # rampFX is loaded as a float, which hashes like the int keys
+            cmds.optionMenu(self.uiPaintMetricsRampMenu, edit=True, value=_RAMP_ID_TO_NAME.get(ui.rampFX, ' '))
 
     def debugFrameSize(self):
         """
@@ -873,10 +1029,29 @@ class spPaint3dWin(object):
         """
         method to check if there's any running context to update
         """
-        if self.ctx:
+        if self.ctx and not self._batching:
             # there's a context object that can be updated
+            state = (self.ctx, self.uiValues, self.uiValues.snapshot(), self.transform, self.transform.snapshot(),
+                     self.sourceList, self.sourceList._rev, self.targetList, self.targetList._rev)
+            if state == self._ctxState:
+                # same options and lists as the last update, typically repeated events from a slider drag
+                return
+            self._ctxState = state
             self.ctx.runtimeUpdate(self.uiValues, self.transform, self.sourceList, self.targetList)
 
+    @contextmanager
+    def _batchUpdates(self):
+        """
+        hold back the context updates for the wrapped block, the context is updated once when leaving the outer block
+        """
+        self._batching += 1
+        try:
+            yield
+        finally:
+            self._batching -= 1
+            if not self._batching:
+                self.updateCtx()
+
     def uiListCallback(self, *args):
         """
         textScrollList callback to manage the addition/removal/reset of the source & target object lists
@@ -885,41 +1060,49 @@ class spPaint3dWin(object):
         mode = args[0]
         textlist = args[1]
         if textlist == 'uiSourceList':
-            objlist = 'sourceList'
+            objlist = self.sourceList
         else:
-            objlist = 'targetList'
+            objlist = self.targetList
+        # resolving the control once for all the edits below
+        uilist = getattr(self, textlist)
 
         if mode == 'add':
             # ADD
-            objselected = cmds.ls(selection=True)
+            # the active selection list only holds existing nodes, no need to check them again with objExists
+            if om2 is None:
+                objselected = cmds.ls(selection=True)
+            else:
+                objselected = om2.MGlobal.getActiveSelectionList().getSelectionStrings()
+            added = []
             for obj in objselected:
-                addresult, addcomment = self.__dict__[objlist].addObj(obj)
+                addresult, addcomment = objlist.addObj(obj)
                 if addresult == None:
                     # an exception occured, printing debut info
                     self.errorHandle.raiseError(addcomment)
                 else:
                     # an object was added to the dict, to be added to the UI list
-                    if cmds.objExists(addresult):
-                        # making sure the object does exist
-                        cmds.textScrollList(self.__dict__[textlist], edit=True, append=addresult)
-                        # print ('added succesfully:', addresult)
+                    added.append(addresult)
+            if added:
+                # append is a multi-use flag, updating the UI list with a single command
+                cmds.textScrollList(uilist, edit=True, append=added)
 
         elif mode == 'clr':
             # CLEAR
-            cmds.textScrollList(self.__dict__[textlist], edit=True, removeAll=True)
-            self.__dict__[objlist].clrObj()
+            cmds.textScrollList(uilist, edit=True, removeAll=True)
+            objlist.clrObj()
 
         elif mode == 'rem':
             # REMOVE
-            remlist = cmds.textScrollList(self.__dict__[textlist], query=True, selectItem=True)
+            remlist = cmds.textScrollList(uilist, query=True, selectItem=True)
             if remlist:
                 # list is not empty
                 for remobj in remlist:
                     # iterate through all the selected obj to remove
-                    self.__dict__[objlist].delObj(remobj)
-                    cmds.textScrollList(self.__dict__[textlist], edit=True, removeItem=remobj)
+                    objlist.delObj(remobj)
+                # removeItem is a multi-use flag, updating the UI list with a single command
+                cmds.textScrollList(uilist, edit=True, removeItem=remlist)
 
-        # self.__dict__[objlist].printObj()
+        # objlist.printObj()
         self.updateCtx()
 
     def genericContextCallback(self, *args):
@@ -929,16 +1112,13 @@ class spPaint3dWin(object):
         # print "genericCallback called: " + str(args)
 
         # delete the setup option UI if it's opened
-        if cmds.window(spPaint3dSetupID, exists=True):
-            cmds.deleteUI(spPaint3dSetupID)
+        deleteToolWindow(spPaint3dSetupID)
 
         # validate the objects from both lists and raise an error if necessary
         sourcevalid = self.sourceList.validateObjects()
         targetvalid = self.targetList.validateObjects()
         duplicateerror = self.sourceList.hasDuplicate(self.targetList)
 
-        self.uiUpdatePaintDistanceUnit()
-
         if not sourcevalid:
             self.errorHandle.raiseError("Source list is empty or object(s) have been deleted. FIX!")
         elif not targetvalid:
@@ -965,9 +1145,21 @@ class spPaint3dWin(object):
         """
         Create setup UI
         """
-        if cmds.window(spPaint3dSetupID, exists=True):
-            cmds.deleteUI(spPaint3dSetupID)
+        deleteToolWindow(spPaint3dSetupID)
+        # enable state and values last applied to the setup controls, the new controls have none yet
+        self._lastEnables = {}
+        self._lastSetupValues = {}
 
+        # building the controls isn't something the user should be able to undo
+        with noUndo():
+            self.buildSetupWindow()
+            self.updateUISetupControls(uiOptions)
+        cmds.showWindow(self.uiSetupWin)
+
+    def buildSetupWindow(self):
+        """
+        Create all the setup window controls
+        """
         self.uiSetupWin = cmds.window(spPaint3dSetupID, title=("spPaint3dSetup | " + str(spPaint3dVersion)), width=250,
                                       height=450, resizeToFitChildren=True, sizeable=True, titleBar=True,
                                       minimizeButton=False, maximizeButton=False, menuBar=False, menuBarVisible=False,
@@ -978,13 +1170,10 @@ class spPaint3dWin(object):
         # ----------------------
         self.uiSetupTopColumn = cmds.columnLayout(adjustableColumn=True, columnAttach=('both', 5))
         self.uiSetupTopForm = cmds.formLayout(numberOfDivisions=100)
-        self.uiSetupBtnHelp = cmds.button(label='Help',
-                                          command=lambda *args: self.setupButtonCallback('uiSetupBtnHelp', args))
+        self.uiSetupBtnHelp = cmds.button(label='Help', command=partial(self.setupButtonCallback, 'uiSetupBtnHelp'))
         self.uiSetupBtnHomepage = cmds.button(label='Homepage',
-                                              command=lambda *args: self.setupButtonCallback('uiSetupBtnHomepage',
-                                                                                             args))
-        self.uiSetupBtnReset = cmds.button(label='Reset',
-                                           command=lambda *args: self.setupButtonCallback('uiSetupBtnReset', args))
+                                              command=partial(self.setupButtonCallback, 'uiSetupBtnHomepage'))
+        self.uiSetupBtnReset = cmds.button(label='Reset', command=partial(self.setupButtonCallback, 'uiSetupBtnReset'))
 
         cmds.formLayout(self.uiSetupTopForm, edit=True,
                         attachControl=[(self.uiSetupBtnHomepage, 'left', 5, self.uiSetupBtnHelp),
@@ -998,8 +1187,8 @@ class spPaint3dWin(object):
         self.uiSetupDuplicateFrame = cmds.frameLayout(label='Duplicate Options', marginHeight=5, marginWidth=20)
         self.uiSetupDuplicateForm = cmds.formLayout(numberOfDivisions=100)
         self.uiSetupChkInputConn = cmds.checkBoxGrp(label='Preserve input connections',
-                                                    changeCommand=lambda *args: self.setupCallback(
-                                                        'uiSetupChkInputConn', args), numberOfCheckBoxes=1, width=170)
+                                                    changeCommand=partial(self.setupCallback, 'uiSetupChkInputConn'),
+                                                    numberOfCheckBoxes=1, width=170)
 
         cmds.setParent(self.uiSetupTopColumn)
 
@@ -1010,10 +1199,9 @@ class spPaint3dWin(object):
         self.uiSetupNormalForm = cmds.formLayout(numberOfDivisions=100)
         self.uiSetupNormalCol = cmds.radioCollection()
         self.uiSetupNormalSmooth = cmds.radioButton(label='Geometry normal', align='right',
-                                                    onCommand=lambda *args: self.setupCallback('uiSetupNormalCol',
-                                                                                               True))
+                                                    onCommand=partial(self.setupCallback, 'uiSetupNormalCol', True))
         self.uiSetupNormalHard = cmds.radioButton(label='Force hard normal', align='right',
-                                                  onCommand=lambda *args: self.setupCallback('uiSetupNormalCol', False))
+                                                  onCommand=partial(self.setupCallback, 'uiSetupNormalCol', False))
 
         cmds.formLayout(self.uiSetupNormalForm, edit=True,
                         attachControl=[(self.uiSetupNormalHard, 'top', 5, self.uiSetupNormalSmooth)])
@@ -1027,9 +1215,9 @@ class spPaint3dWin(object):
         self.uiSetupFluxForm = cmds.formLayout(numberOfDivisions=100)
         self.uiSetupFluxCol = cmds.radioCollection()
         self.uiSetupFluxTimer = cmds.radioButton(label='Timer', align='right',
-                                                 onCommand=lambda *args: self.setupCallback('uiSetupFluxCol', False))
+                                                 onCommand=partial(self.setupCallback, 'uiSetupFluxCol', False))
         self.uiSetupFluxDistance = cmds.radioButton(label='Distance threshold', align='right',
-                                                    onCommand=lambda *args: self.setupCallback('uiSetupFluxCol', True))
+                                                    onCommand=partial(self.setupCallback, 'uiSetupFluxCol', True))
 
         cmds.formLayout(self.uiSetupFluxForm, edit=True,
                         attachControl=[(self.uiSetupFluxDistance, 'top', 5, self.uiSetupFluxTimer)])
@@ -1042,26 +1230,24 @@ class spPaint3dWin(object):
         self.uiSetupHierarchyFrame = cmds.frameLayout(label='Hierarchy Management', marginHeight=5, marginWidth=20)
         self.uiSetupHierarchyForm = cmds.formLayout(numberOfDivisions=100)
         self.uiSetupHierarchyActive = cmds.checkBoxGrp(label='Activate objects grouping',
-                                                       changeCommand=lambda *args: self.setupCallback(
-                                                           'uiSetupHierarchyActive', args), numberOfCheckBoxes=1)
-        self.uiSetupHierarchyCol = cmds.radioCollection()
-        self.uiSetupHierarchySession = cmds.radioButton(label='Single paint session group', align='right',
-                                                        onCommand=lambda *args: self.setupCallback(
-                                                            'uiSetupHierarchySession', args))
-        self.uiSetupHierarchyStroke = cmds.radioButton(label='Stroke sorted group(s)', align='right',
-                                                       onCommand=lambda *args: self.setupCallback(
-                                                           'uiSetupHierarchyStroke', args))
-        self.uiSetupHierarchySource = cmds.radioButton(label='Source sorted group(s)', align='right',
-                                                       onCommand=lambda *args: self.setupCallback(
-                                                           'uiSetupHierarchySource', args))
+                                                       changeCommand=partial(self.setupCallback,
+                                                                             'uiSetupHierarchyActive'),
+                                                       numberOfCheckBoxes=1)
+        # radio buttons are ordered by grouping mode, button index = mode + 1
+        self.uiSetupHierarchyGrp = cmds.radioButtonGrp(numberOfRadioButtons=3, vertical=True,
+                                                       labelArray3=('Single paint session group',
+                                                                    'Stroke sorted group(s)',
+                                                                    'Source sorted group(s)'),
+                                                       onCommand1=partial(self.setupCallback, 'uiSetupHierarchyGrp',
+                                                                          context.sp3dGroupSession),
+                                                       onCommand2=partial(self.setupCallback, 'uiSetupHierarchyGrp',
+                                                                          context.sp3dGroupStroke),
+                                                       onCommand3=partial(self.setupCallback, 'uiSetupHierarchyGrp',
+                                                                          context.sp3dGroupSource))
 
         cmds.formLayout(self.uiSetupHierarchyForm, edit=True,
-                        attachControl=[(self.uiSetupHierarchySession, 'top', 5, self.uiSetupHierarchyActive),
-                                       (self.uiSetupHierarchyStroke, 'top', 5, self.uiSetupHierarchySession),
-                                       (self.uiSetupHierarchySource, 'top', 5, self.uiSetupHierarchyStroke)])
-        cmds.formLayout(self.uiSetupHierarchyForm, edit=True, attachForm=[(self.uiSetupHierarchySession, 'left', 25),
-                                                                          (self.uiSetupHierarchyStroke, 'left', 25),
-                                                                          (self.uiSetupHierarchySource, 'left', 25)])
+                        attachForm=[(self.uiSetupHierarchyGrp, 'left', 25)],
+                        attachControl=[(self.uiSetupHierarchyGrp, 'top', 5, self.uiSetupHierarchyActive)])
 
         cmds.setParent(self.uiSetupTopColumn)
 
@@ -1072,11 +1258,11 @@ class spPaint3dWin(object):
         self.uiSetupPaintOptionsForm = cmds.formLayout(numberOfDivisions=100)
         self.uiSetupPlaceRotate = cmds.floatFieldGrp(label='Place Mode rotate increment', precision=2, vis=True, w=250,
                                                      cw=[(1, 145), (2, 50)],
-                                                     changeCommand=lambda *args: self.uiSetupPlaceRotateCallback(
-                                                         "placeRotate", args))
+                                                     changeCommand=partial(self.uiSetupPlaceRotateCallback,
+                                                                           "placeRotate"))
         self.uiSetupContinuousTransform = cmds.checkBoxGrp(label='Continuous transform',
-                                                           changeCommand=lambda *args: self.setupCallback(
-                                                               'uiSetupContinuousTransform', args),
+                                                           changeCommand=partial(self.setupCallback,
+                                                                                 'uiSetupContinuousTransform'),
                                                            numberOfCheckBoxes=1)
 
         cmds.formLayout(self.uiSetupPaintOptionsForm, edit=True, attachForm=[(self.uiSetupPlaceRotate, 'top', 0)],
@@ -1090,8 +1276,9 @@ class spPaint3dWin(object):
         self.uiSetupDevFrame = cmds.frameLayout(label='Development Feature', marginHeight=5, marginWidth=20)
         self.uiSetupDevForm = cmds.formLayout(numberOfDivisions=100)
         self.uiSetupRealTimeRampFX = cmds.checkBoxGrp(label='Realtime RampFX',
-                                                      changeCommand=lambda *args: self.setupCallback(
-                                                          'uiSetupRealTimeRampFX', args), numberOfCheckBoxes=1)
+                                                      changeCommand=partial(self.setupCallback,
+                                                                            'uiSetupRealTimeRampFX'),
+                                                      numberOfCheckBoxes=1)
 
         cmds.formLayout(self.uiSetupDevForm, edit=True,
                         attachForm=[(self.uiSetupRealTimeRampFX, 'top', 0), (self.uiSetupRealTimeRampFX, 'left', 0)])
@@ -1102,50 +1289,56 @@ class spPaint3dWin(object):
         # 
         # ----------------------
 
-        self.updateUISetupControls(uiOptions)
-        cmds.showWindow(self.uiSetupWin)
-
     def updateUISetupControls(self, ui):
         """
         Will update the self ui controls with the values stores in the passed instance object
-        """
-        if sp3d_log:
-            print(ui.__dict__)
-        cmds.checkBoxGrp(self.uiSetupChkInputConn, edit=True, value1=ui.preserveConn)
-        cmds.checkBoxGrp(self.uiSetupRealTimeRampFX, edit=True, value1=ui.realTimeRampFX)
-        cmds.radioButton(self.uiSetupNormalSmooth, edit=True, select=ui.smoothNormal)
-        cmds.radioButton(self.uiSetupNormalHard, edit=True, select=(not ui.smoothNormal))
-        cmds.radioButton(self.uiSetupFluxTimer, edit=True, select=(not ui.paintFlux))
-        cmds.radioButton(self.uiSetupFluxDistance, edit=True, select=ui.paintFlux)
-
-        cmds.floatFieldGrp(self.uiSetupPlaceRotate, edit=True, visible=True, v1=ui.placeRotate)
-        cmds.checkBoxGrp(self.uiSetupContinuousTransform, edit=True, value1=ui.continuousTransform)
-
-        # toggling the proper hierarchy grouping options
-        cmds.checkBoxGrp(self.uiSetupHierarchyActive, edit=True, value1=ui.hierarchy)
-        if sp3d_log:
-            print("ui.hierarchy %s" % ui.hierarchy)
-        if ui.hierarchy:
-            # toggling radio button enabled
-            if sp3d_log:
-                print("toggling grouping option ON")
-            cmds.radioButton(self.uiSetupHierarchySession, edit=True, enable=True)
-            cmds.radioButton(self.uiSetupHierarchyStroke, edit=True, enable=True)
-            cmds.radioButton(self.uiSetupHierarchySource, edit=True, enable=True)
-        else:
-            # toggling radio button disable
-            if sp3d_log:
-                print("toggling grouping option OFF")
-            cmds.radioButton(self.uiSetupHierarchySession, edit=True, enable=False)
-            cmds.radioButton(self.uiSetupHierarchyStroke, edit=True, enable=False)
-            cmds.radioButton(self.uiSetupHierarchySource, edit=True, enable=False)
-
-        if ui.group == 0.0:
-            cmds.radioButton(self.uiSetupHierarchySession, edit=True, select=True)
-        elif ui.group == 1.0:
-            cmds.radioButton(self.uiSetupHierarchyStroke, edit=True, select=True)
-        elif ui.group == 2.0:
-            cmds.radioButton(self.uiSetupHierarchySource, edit=True, select=True)
+        only the controls whose option changed since the last update are edited
+        """
+        last = self._lastSetupValues
+        values = dict((varname, getattr(ui, varname)) for varname in self.setupDisplayed)
+        if values == last:
+            return
+        changed = set(varname for varname, value in values.items() if varname not in last or last[varname] != value)
+
+        with noUndo(), suspendRefresh():
+            if SP3D_LOG:
+                ui.dumpVars()
+            if 'preserveConn' in changed:
+                cmds.checkBoxGrp(self.uiSetupChkInputConn, edit=True, value1=ui.preserveConn)
+            if 'realTimeRampFX' in changed:
+                cmds.checkBoxGrp(self.uiSetupRealTimeRampFX, edit=True, value1=ui.realTimeRampFX)
+            if 'smoothNormal' in changed:
+                cmds.radioButton(self.uiSetupNormalSmooth, edit=True, select=ui.smoothNormal)
+                cmds.radioButton(self.uiSetupNormalHard, edit=True, select=(not ui.smoothNormal))
+            if 'paintFlux' in changed:
+                cmds.radioButton(self.uiSetupFluxTimer, edit=True, select=(not ui.paintFlux))
+                cmds.radioButton(self.uiSetupFluxDistance, edit=True, select=ui.paintFlux)
+
+            if 'placeRotate' in changed:
+                cmds.floatFieldGrp(self.uiSetupPlaceRotate, edit=True, visible=True, v1=ui.placeRotate)
+            if 'continuousTransform' in changed:
+                cmds.checkBoxGrp(self.uiSetupContinuousTransform, edit=True, value1=ui.continuousTransform)
+
+            # toggling the proper hierarchy grouping options
+            if 'hierarchy' in changed:
+                cmds.checkBoxGrp(self.uiSetupHierarchyActive, edit=True, value1=ui.hierarchy)
+                _dbg("ui.hierarchy %s", ui.hierarchy)
+            if 'group' in changed:
+                # the stored group value is a float
+                cmds.radioButtonGrp(self.uiSetupHierarchyGrp, edit=True, select=int(ui.group) + 1)
+            self._applyState(ui)
+        self._lastSetupValues = values
+
+    def _applyState(self, ui):
+        """
+        Only place toggling the enable state of the setup window controls, from the rules of getSetupEnables
+        controls are only edited when their state differs from the last one applied
+        """
+        for control, enable in getSetupEnables(ui).items():
+            if self._lastEnables.get(control) != enable:
+                _dbg("toggling %s %s", control, 'ON' if enable else 'OFF')
+                cmds.control(getattr(self, control), edit=True, enable=enable)
+                self._lastEnables[control] = enable
 
     def resetOptions(self):
         """
@@ -1155,24 +1348,29 @@ class spPaint3dWin(object):
         # TODO: update setup window UI
         # TODO: callback main UI window for update
         # TODO: callback to context if active with new options
-        self.uiValues.resetVars()
-        self.updateUISetupControls(self.uiValues)
-        self.updateUIControls(self.uiValues)
-        self.uiTransformReset()
+        mainwin = cmds.window(spPaint3dGuiID, exists=True)
+        # all the controls edits below are laid out at once when the refresh resumes, then redrawn a single time
+        with suspendRefresh(redraw=True):
+            with self._batchUpdates():
+                self.uiValues.resetVars()
+                self.updateUISetupControls(self.uiValues)
+                self.updateUIControls(self.uiValues)
+                self.uiTransformReset()
+
+            # deleting windowprefs and forcing resize
+            if cmds.windowPref(spPaint3dSetupID, exists=True):
+                cmds.windowPref(spPaint3dSetupID, remove=True)
+            if cmds.windowPref(spPaint3dGuiID, exists=True):
+                cmds.windowPref(spPaint3dGuiID, remove=True)
 
-        # deleting windowprefs and forcing resize
-        if cmds.windowPref(spPaint3dSetupID, exists=True):
-            cmds.windowPref(spPaint3dSetupID, remove=True)
-        if cmds.windowPref(spPaint3dGuiID, exists=True):
-            cmds.windowPref(spPaint3dGuiID, remove=True)
+            if mainwin:
+                # forcing all frame to uncollapse if any
+                for frame in (self.uiSourceFrame, self.uiTransformFrame, self.uiTargetFrame, self.uiPaintFrame,
+                              self.uiPaintMetricsFrame):
+                    cmds.frameLayout(frame, edit=True, collapse=False)
 
-        if cmds.window(spPaint3dGuiID, exists=True):
-            # forcing all frame to uncollapse if any
-            cmds.frameLayout(self.uiSourceFrame, edit=True, collapse=False)
-            cmds.frameLayout(self.uiTransformFrame, edit=True, collapse=False)
-            cmds.frameLayout(self.uiTargetFrame, edit=True, collapse=False)
-            cmds.frameLayout(self.uiPaintFrame, edit=True, collapse=False)
-            cmds.frameLayout(self.uiPaintMetricsFrame, edit=True, collapse=False)
+        if mainwin:
+            # resizing last, once the uncollapsed frames are laid out
             self.resizeWindow('winui', spPaint3dGuiID_Height)  # force a resize to prevent some weird UI issue on mac
 
     def setupButtonCallback(self, *args):
@@ -1194,55 +1392,116 @@ class spPaint3dWin(object):
     def uiSetupPlaceRotateCallback(self, *args):
         """
         Callback for place rotate field change
-        INPUT: [variable name, (value to update,)]
+        INPUT: [variable name, value to update]
         """
-        self.uiValues.__dict__[args[0]] = float(args[1][0])
-        self.uiValues.commitVars()
+        value = float(args[1])
+        setattr(self.uiValues, args[0], value)
+        # the edited field already displays its new value
+        self._lastSetupValues[args[0]] = value
+        self._scheduleCommit()
         self.updateCtx()
 
     def setupCallback(self, *args):
         """
-        Manage checkbox and radio buttons
-        uiNormalCol
-        uiFluxCol
-        uiSetupHierarchyActive
-        """
-        radiocol = args[0]
-        if sp3d_log:
-            print('setupCallback control:%s | value: %s' % (args[0], args[1]))
-        if radiocol == 'uiSetupNormalCol':
-            self.uiValues.smoothNormal = args[1]
-        elif radiocol == 'uiSetupFluxCol':
-            self.uiValues.paintFlux = args[1]
-        elif radiocol == 'uiSetupChkInputConn':
-            # Maya callback sends a tuple back for checkbox but seems not a boolean and has to be processed???
-            self.uiValues.preserveConn = getBoolFromMayaControl(args[1][0], self.mayaVersion)
-        elif radiocol == 'uiSetupHierarchyActive':
-            self.uiValues.hierarchy = getBoolFromMayaControl(args[1][0], self.mayaVersion)
-        elif radiocol == 'uiSetupRealTimeRampFX':
-            self.uiValues.realTimeRampFX = getBoolFromMayaControl(args[1][0], self.mayaVersion)
-        elif radiocol == 'uiSetupHierarchySession':
-            self.uiValues.group = 0.0
-        elif radiocol == 'uiSetupHierarchyStroke':
-            self.uiValues.group = 1.0
-        elif radiocol == 'uiSetupHierarchySource':
-            self.uiValues.group = 2.0
-        elif radiocol == 'uiSetupContinuousTransform':
-            self.uiValues.continuousTransform = getBoolFromMayaControl(args[1][0], self.mayaVersion)
+        Manage checkbox and radio buttons, the option to update is looked up from the setupOptions class attribute
+        INPUT: [control name, value to update]
+        """
+        _dbg('setupCallback control:%s | value: %s', args[0], args[1])
+        option = self.setupOptions.get(args[0])
+        if option:
+            attr, checkbox = option
+            value = args[1]
+            if checkbox:
+                # Maya callback sends a value back for checkbox but seems not a boolean and has to be processed???
+                value = self._toBool(value)
+            setattr(self.uiValues, attr, value)
+            # the clicked control already displays its new value
+            self._lastSetupValues[attr] = value
         else:
             print(args)
 
         self.uiValues.commitVars()
-        self.updateUIControls(self.uiValues)
-        self.updateUISetupControls(self.uiValues)
-        if sp3d_log:
-            print("done updating SetupUI")
+        with suspendRefresh():
+            # the main window shows the flux control picked in the setup window
+            self.updateUIControls(self.uiValues)
+            # the setup controls already display the clicked value, only their enable state may change
+            self._applyState(self.uiValues)
+        _dbg("done updating SetupUI")
 
 
 # -----------------------------------------------------------------------------------
 #    UTILITIES
 # -----------------------------------------------------------------------------------
 
+def deleteToolWindow(winID):
+    """
+    delete the tool window if it's opened
+    """
+    if cmds.window(winID, exists=True):
+        cmds.deleteUI(winID)
+
+
+def _printDbg(msg, *args):
+    """
+    print the debug message to the script editor, the message is only formatted here
+    """
+    print(msg % args if args else msg)
+
+
+def _noDbg(msg, *args):
+    """
+    stand-in for _printDbg when logging is disabled
+    """
+    pass
+
+
+# selected once at import, the disabled debug calls neither test the log flag nor format their message
+_dbg = _printDbg if SP3D_LOG else _noDbg
+
+
+@contextmanager
+def suspendRefresh(redraw=False):
+    """
+    suspend the Maya refresh for the wrapped block, nested blocks only resume it when leaving the outer one
+    redraw = force a single refresh once the outer block resumed it
+    """
+    global _refreshDepth
+    if not _refreshDepth:
+        cmds.refresh(suspend=True)
+    _refreshDepth += 1
+    try:
+        yield
+    finally:
+        _refreshDepth -= 1
+        if not _refreshDepth:
+            cmds.refresh(suspend=False)
+            if redraw:
+                cmds.refresh()
+
+
+@contextmanager
+def noUndo():
+    """
+    suspend the undo recording for the wrapped block, restoring the previous state afterwards
+    """
+    state = cmds.undoInfo(query=True, stateWithoutFlush=True)
+    if state:
+        cmds.undoInfo(stateWithoutFlush=False)
+    try:
+        yield
+    finally:
+        if state:
+            cmds.undoInfo(stateWithoutFlush=True)
+
+
+def getSetupEnables(ui):
+    """
+    return the enable state of the setup window controls for the ui tool options, as {control attribute name: bool}
+    """
+    # grouping modes are only selectable while grouping is active
+    return {'uiSetupHierarchyGrp': bool(ui.hierarchy)}
+
+
 def getBoolFromMayaControl(uicontrol, version):
     """
     return the bool state of the passed uicontrol, return false by default
@@ -1262,36 +1521,56 @@ def getBoolFromMayaControl(uicontrol, version):
 def getMayaVersion():
     """
     attempt to detect the version of maya and return it as a numerical value.
+    the version doesn't change during a session, it's only detected on the first call.
     """
-    version = cmds.about(v=True)
-    supportedversion = False
-    while not supportedversion:
-        try:
-            version = int(version[:4])
-            supportedversion = True
-        except ValueError:
-            result = cmds.promptDialog(title='Enter Maya version',
-                                       message='Couldn\'t determine the version of Maya\n, please enter the 4 digits of the maya version you are using (ie: 2011)',
-                                       button=['OK', 'Cancel & Quit'], defaultButton='OK', cancelButton='Cancel & Quit',
-                                       dismissString='Cancel & Quit')
-            if result == 'OK':
-                version = cmds.promptDialog(query=True, text=True)
-            else:
-                sys.exit()
+    global _mayaVersion
+    if _mayaVersion is not None:
+        return _mayaVersion
+
+    version = parseMayaVersion(cmds.about(v=True))
+    if version is None:
+        version = promptMayaVersion()
     if version <= 2010:
         cmds.confirmDialog(title='Maya version alert',
                            message='This version of the script was updated for Maya 2011 and above.\nThere will be unexpected stuff happening with older versions, or not...')
+    _mayaVersion = version
     return version
 
 
-def getDAGPath(node, depth=False):
+def parseMayaVersion(text):
+    """
+    return the 4 digits year leading the passed maya version string (ie: 2011, 2022 from '2022.1') as an int, None if not found
+    """
+    match = _VERSION_RE.match(text.strip())
+    return int(match.group(1)) if match else None
+
+
+def promptMayaVersion():
+    """
+    ask the user for the maya version until 4 valid digits are entered, quit if the dialog is cancelled
+    """
+    while True:
+        result = cmds.promptDialog(title='Enter Maya version',
+                                   message='Couldn\'t determine the version of Maya\n, please enter the 4 digits of the maya version you are using (ie: 2011)',
+                                   button=['OK', 'Cancel & Quit'], defaultButton='OK', cancelButton='Cancel & Quit',
+                                   dismissString='Cancel & Quit')
+        if result != 'OK':
+            sys.exit()
+        version = parseMayaVersion(cmds.promptDialog(query=True, text=True))
+        if version is not None:
+            return version
+
+
+def getDAGPath(node, depth=False, nodetype=None):
     """
     Return the DAG path of the node argument (node must be a transform, if not, will attempt to locate its immediate parent and make sure it's a transform and will proceed from there)
     Return the extended DAG path to the node's shape when depth=True
     Return None if the node doesn't have any shape children, or more than one children shape.
+    nodetype may be passed when the caller already queried the node type, to save a redundant objectType query
     """
     dag = None
-    nodetype = cmds.objectType(node)
+    if nodetype is None:
+        nodetype = cmds.objectType(node)
 
     if nodetype != 'transform':
         # node is not a transform, will proceed upstream to its immediate parent and will verify if the parent is a transform